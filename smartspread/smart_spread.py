@@ -1,12 +1,54 @@
+import asyncio
+import weakref
+
 import gspread
 from gspread import Spreadsheet
+from gspread.utils import absolute_range_name
 from logorator import Logger
-from typing import Union, Dict, Optional, Literal
-from functools import cached_property
+from typing import Union, Dict, Optional, Literal, Iterator
+from contextlib import contextmanager
+from functools import cached_property, partial
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import smart_tab
 
 
+class _RateLimitRetry(Retry):
+    """Retry 429 for every method; 5xx and read errors only for idempotent methods.
+
+    A rate-limited request was not carried out, so even POSTs (create, add_worksheet,
+    share) can be repeated. After a 5xx or a dropped response the POST may already
+    have taken effect, so only the methods in allowed_methods are retried then.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _mount_retry_adapter(gc: gspread.Client) -> None:
+    """Retry rate-limited and transient Sheets API errors with exponential backoff.
+
+    Honors the Retry-After header. After the last attempt the response is handed
+    back to gspread unchanged, so errors still surface as gspread.exceptions.APIError.
+    """
+    retry = _RateLimitRetry(
+            total=6,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    # gspread >= 6 keeps the session on http_client, older versions on the client itself
+    session = getattr(getattr(gc, "http_client", None), "session", None) or gc.session
+    session.mount("https://", adapter)
+
+
 class SmartSpread:
     """High-level interface for managing Google Sheets spreadsheets.
     
@@ -14,6 +56,9 @@ class SmartSpread:
     with automatic authentication and caching.
     """
 
+    # cached_property values dropped by refresh()
+    _CACHED_PROPERTIES = ("sheet", "tab_names", "_tab_name_set")
+
     def __init__(
         self,
         sheet_identifier: str = "",
@@ -34,6 +79,9 @@ class SmartSpread:
         """
         self.user_email = user_email
         self.sheet_identifier = sheet_identifier
+        self._tab_cache: dict[str, tuple[gspread.Worksheet, list[list]]] = {}
+        # Tabs handed out by this instance; their writes would make prefetched values stale
+        self._open_tabs: weakref.WeakSet = weakref.WeakSet()
 
         if service_account_data:
             # Auth from dict
@@ -52,6 +100,8 @@ class SmartSpread:
         else:
             raise ValueError("Must provide either a 'key_file' path or 'service_account_data' for authentication.")
 
+        _mount_retry_adapter(self.gc)
+
 
     def __str__(self):
         return self.sheet_identifier
@@ -129,6 +179,25 @@ class SmartSpread:
             Logger.note(f"Error granting access: {e}", mode="short")
             raise RuntimeError(f"Failed to grant access to spreadsheet: {e}") from e
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Queue write_data calls made inside the block and send them together on exit.
+        
+        All writes to this spreadsheet go out as one batchUpdate (clearing and
+        formatting) plus one values.batchUpdate, regardless of the number of tabs.
+        Nothing is sent if the block raises.
+        
+        Raises:
+            RuntimeError: If the batched write fails
+        """
+        write_batch = smart_tab._WriteBatch(self.sheet)
+        token = smart_tab._active_write_batch.set(write_batch)
+        try:
+            yield
+        finally:
+            smart_tab._active_write_batch.reset(token)
+        write_batch.flush()
+
     @property
     def url(self) -> str:
         """Get the spreadsheet URL.
@@ -149,16 +218,151 @@ class SmartSpread:
         Returns:
             SmartTab: Tab interface object
         """
-        tab = smart_tab.SmartTab(sheet=self.sheet, tab_name=tab_name, data_format=data_format, keep_number_formatting=keep_number_formatting)
+        worksheet, values = self._tab_cache.pop(tab_name, (None, None))
+        if keep_number_formatting:
+            # Prefetched values are unformatted
+            values = None
+        tab = smart_tab.SmartTab(
+                sheet=self.sheet,
+                tab_name=tab_name,
+                data_format=data_format,
+                keep_number_formatting=keep_number_formatting,
+                worksheet=worksheet,
+                pre_fetched_values=values,
+        )
+        self._open_tabs.add(tab)
         
-        # Invalidate tab_names cache since a new tab may have been created
-        try:
-            del self.tab_names
-        except AttributeError:
-            pass
+        # Invalidate tab_names cache if a new tab may have been created
+        if tab_name not in self.__dict__.get("tab_names", ()):
+            self._invalidate_tab_names()
         
         return tab
 
+    async def atab(self, tab_name: str = "Sheet 1", data_format: Literal["DataFrame", "list", "dict"] = "DataFrame", keep_number_formatting: bool = False) -> "smart_tab.SmartTab":
+        """Async variant of tab().
+        
+        The blocking gspread calls run in the event loop's default executor, so
+        several tabs can be opened concurrently with asyncio.gather.
+        
+        Args:
+            tab_name: Name of the tab
+            data_format: Format for data operations ('DataFrame', 'list', 'dict')
+            keep_number_formatting: If True, preserve number formatting as strings
+            
+        Returns:
+            SmartTab: Tab interface object
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self._load_tab, tab_name=tab_name, data_format=data_format, keep_number_formatting=keep_number_formatting))
+
+    def _load_tab(self, **tab_kwargs) -> "smart_tab.SmartTab":
+        tab = self.tab(**tab_kwargs)
+        # Tabs read lazily; read now so the download happens in the worker thread
+        _ = tab.data
+        return tab
+
+    async def atabs(self, tab_names: list[str], data_format: Literal["DataFrame", "list", "dict"] = "DataFrame", keep_number_formatting: bool = False, max_concurrency: int = 8) -> list["smart_tab.SmartTab"]:
+        """Open several tabs concurrently.
+        
+        Args:
+            tab_names: Names of the tabs
+            data_format: Format for data operations ('DataFrame', 'list', 'dict')
+            keep_number_formatting: If True, preserve number formatting as strings
+            max_concurrency: Maximum number of tabs loaded at the same time
+            
+        Returns:
+            list[SmartTab]: Tab interface objects, in the order of tab_names
+        """
+        # Open the spreadsheet once up front instead of racing for it in every worker
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, lambda: self.sheet)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load(name: str) -> "smart_tab.SmartTab":
+            async with semaphore:
+                return await self.atab(tab_name=name, data_format=data_format, keep_number_formatting=keep_number_formatting)
+
+        return list(await asyncio.gather(*(load(name) for name in tab_names)))
+
+    def tabs(self, tab_names: list[str], data_format: Literal["DataFrame", "list", "dict"] = "DataFrame", keep_number_formatting: bool = False) -> list["smart_tab.SmartTab"]:
+        """Get or create several tabs, reading all existing ones in a single request.
+        
+        Args:
+            tab_names: Names of the tabs
+            data_format: Format for data operations ('DataFrame', 'list', 'dict')
+            keep_number_formatting: If True, preserve number formatting as strings
+            
+        Returns:
+            list[SmartTab]: Tab interface objects, in the order of tab_names
+            
+        Raises:
+            RuntimeError: If the batched read fails
+        """
+        for name in tab_names:
+            self._tab_cache.pop(name, None)
+        worksheets, values = self._read_tabs(tab_names, keep_number_formatting)
+
+        tabs = [
+                smart_tab.SmartTab(
+                        sheet=self.sheet,
+                        tab_name=name,
+                        data_format=data_format,
+                        keep_number_formatting=keep_number_formatting,
+                        worksheet=worksheets.get(name),
+                        pre_fetched_values=values.get(name),
+                )
+                for name in tab_names
+        ]
+        self._open_tabs.update(tabs)
+
+        # The listing is current unless new tabs were created
+        if all(name in worksheets for name in tab_names):
+            self._store_tab_names(list(worksheets))
+        else:
+            self._invalidate_tab_names()
+
+        return tabs
+
+    def _read_tabs(self, tab_names: Optional[list[str]], keep_number_formatting: bool = False) -> tuple[dict[str, gspread.Worksheet], dict[str, list[list]]]:
+        """List the worksheets and read the given tabs (all if None) with one batched request."""
+        try:
+            worksheets = {worksheet.title: worksheet for worksheet in self.sheet.worksheets()}
+            if tab_names is None:
+                existing = list(worksheets)
+            else:
+                existing = [name for name in dict.fromkeys(tab_names) if name in worksheets]
+            values = {}
+            if existing:
+                result = self.sheet.values_batch_get(
+                        ranges=[absolute_range_name(name) for name in existing],
+                        params={"valueRenderOption": "FORMATTED_VALUE" if keep_number_formatting else "UNFORMATTED_VALUE"}
+                )
+                for name, value_range in zip(existing, result.get("valueRanges", [])):
+                    values[name] = value_range.get("values", [])
+            return worksheets, values
+        except Exception as e:
+            Logger.note(f"Error reading tabs: {e}", mode="short")
+            raise RuntimeError(f"Failed to read tabs: {e}") from e
+
+    @Logger(mode="short")
+    def _prefetch_all(self) -> None:
+        """Read all tabs with one metadata request and one batched values request.
+        
+        The next tab() call for each tab uses the fetched worksheet and values instead
+        of hitting the API. Each cached tab is used once; refresh() drops the cache.
+        Tabs already opened through this instance are not cached, since they may
+        write before the next tab() call.
+        """
+        worksheets, values = self._read_tabs(None)
+        self._store_tab_names(list(worksheets))
+        open_names = {tab.tab_name for tab in self._open_tabs}
+        self._tab_cache = {
+                name: (worksheets[name], values.get(name, []))
+                for name in worksheets if name not in open_names
+        }
+        Logger.note(f"Prefetched {len(self._tab_cache)} tab(s).", mode="short")
+
     @cached_property
     def tab_names(self) -> list[str]:
         """Get list of all tab names in the spreadsheet.
@@ -177,9 +381,15 @@ class SmartSpread:
 
 
 
+    @cached_property
+    def _tab_name_set(self) -> frozenset[str]:
+        return frozenset(self.tab_names)
+
     def tab_exists(self, tab_name: str) -> bool:
         """Check if a tab exists in the spreadsheet.
         
+        Uses the cached tab_names; call refresh() to see tabs added elsewhere.
+        
         Args:
             tab_name: Name of the tab to check
             
@@ -193,10 +403,7 @@ class SmartSpread:
         if not tab_name:
             raise ValueError("tab_name cannot be empty")
         try:
-            self.sheet.worksheet(tab_name)
-            return True
-        except gspread.exceptions.WorksheetNotFound:
-            return False
+            return tab_name in self._tab_name_set
         except Exception as e:
             Logger.note(f"Error checking if tab exists: {e}", mode="short")
             raise RuntimeError(f"Failed to check if tab '{tab_name}' exists: {e}") from e
@@ -206,11 +413,14 @@ class SmartSpread:
         
         Use this after external changes to reload spreadsheet metadata.
         """
-        try:
-            del self.sheet
-        except AttributeError:
-            pass
-        try:
-            del self.tab_names
-        except AttributeError:
-            pass
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        self._tab_cache = {}
+
+    def _invalidate_tab_names(self) -> None:
+        self.__dict__.pop("tab_names", None)
+        self.__dict__.pop("_tab_name_set", None)
+
+    def _store_tab_names(self, tab_names: list[str]) -> None:
+        self._invalidate_tab_names()
+        self.tab_names = tab_names
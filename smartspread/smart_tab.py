@@ -1,29 +1,139 @@
-import hashlib
-import json
-from typing import Union, Literal
-from functools import cached_property
+import asyncio
+import re
+from contextvars import ContextVar
+from functools import partial
+from typing import Union, Literal, Optional
 
 import gspread
+import orjson
 import pandas as pd
+import xxhash
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from logorator import Logger
 
 
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+_HASH_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj):
+    # orjson already writes NaN and None as null; treat pd.NA the same way
+    if obj is pd.NA:
+        return None
+    return str(obj)
+
+
+def _hash_numbers(hasher, tag: bytes, column: pd.Series, dtype: str, na_value) -> None:
+    # Numbers are hashed as raw buffers, skipping pandas' per-element hash
+    hasher.update(tag)
+    if isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+        missing = column.isna().to_numpy()
+        values = column.to_numpy(dtype=dtype, na_value=na_value)
+        if missing.any():
+            hasher.update(missing)
+    else:
+        values = column.to_numpy().astype(dtype, copy=False)
+    hasher.update(values if values.flags.c_contiguous else values.copy())
+
+
 def _calculate_data_hash(data: Union[pd.DataFrame, list[dict], list[list]]):
     if isinstance(data, pd.DataFrame):
-        data_bytes = pd.util.hash_pandas_object(data, index=True).values.tobytes()
+        hasher = xxhash.xxh3_64(repr(data.columns.tolist()).encode("utf-8"))
+        # xxhash reads uint64 hash arrays and raw column buffers through the buffer protocol, no bytes copy
+        hasher.update(pd.util.hash_pandas_object(data.index).to_numpy())
+        for _, column in data.items():
+            # Hashed by value, not dtype: a frame read back from Sheets (Int64) must match
+            # the frame that was written (int64), so ints, nullable ints and bools share one form
+            kind = column.dtype.kind
+            if kind in "iub":
+                _hash_numbers(hasher, b"i", column, "int64", 0)
+            elif kind == "f":
+                _hash_numbers(hasher, b"f", column, "float64", float("nan"))
+            else:
+                hasher.update(b"o")
+                hasher.update(pd.util.hash_pandas_object(column, index=False).to_numpy())
+        return hasher.hexdigest()
     elif isinstance(data, list):
-        def sanitize(obj):
-            if isinstance(obj, list):
-                return [sanitize(item) for item in obj]
-            elif isinstance(obj, dict):
-                return {k: sanitize(v) for k, v in obj.items()}
-            elif pd.isna(obj):
-                return None
-            return obj
-        data_bytes = json.dumps(sanitize(data), sort_keys=True).encode("utf-8")
+        # Rows (lists or dicts) are streamed into one hasher; no intermediate DataFrame or blob
+        hasher = xxhash.xxh3_64()
+        for row in data:
+            try:
+                encoded = orjson.dumps(row, default=_json_default, option=_HASH_JSON_OPTIONS)
+            except TypeError:
+                # orjson rejects ints beyond 64 bits without calling default
+                encoded = repr(row).encode("utf-8")
+            hasher.update(encoded)
+            hasher.update(b"\x1e")
+        return hasher.hexdigest()
     else:
         raise TypeError("Unsupported data type for hashing.")
-    return hashlib.md5(data_bytes).hexdigest()
+
+
+def _frame_to_rows(df: pd.DataFrame, missing=None) -> list[list]:
+    # Masked assignment on an object array keeps the NA scan in NumPy instead of a per-cell pd.isna
+    values = df.to_numpy(dtype=object, copy=True)
+    values[df.isna().to_numpy(dtype=bool)] = missing
+    return values.tolist()
+
+
+def _is_missing(value) -> bool:
+    return pd.api.types.is_scalar(value) and pd.isna(value)
+
+
+def _cell_value(value):
+    # update_cells skips None, so empty values have to be sent as ""
+    if _is_missing(value):
+        return ""
+    return value
+
+
+def _send_write_requests(sheet: gspread.Spreadsheet, requests: list[dict], value_ranges: list[dict]) -> None:
+    # Clearing and formatting go out as one batchUpdate, values as one values.batchUpdate
+    if requests:
+        sheet.batch_update({"requests": requests})
+    sheet.values_batch_update({
+            "valueInputOption": "USER_ENTERED",
+            "data"            : value_ranges,
+    })
+
+
+class _WriteBatch:
+    """Writes queued by SmartSpread.batch(), sent together by flush()."""
+
+    def __init__(self, sheet: gspread.Spreadsheet):
+        self.sheet = sheet
+        self.requests: list[dict] = []
+        self.value_ranges: list[tuple["SmartTab", dict]] = []
+        self.data_hashes: dict["SmartTab", str] = {}
+
+    def add(self, tab: "SmartTab", requests: list[dict], value_range: dict, data_hash: str, overwrite_tab: bool) -> None:
+        if overwrite_tab:
+            # Clears are sent before all values, so earlier values for the same tab would survive
+            superseded = [queued_tab for queued_tab, _ in self.value_ranges if queued_tab._worksheet.id == tab._worksheet.id]
+            for queued_tab in superseded:
+                self.data_hashes.pop(queued_tab, None)
+            self.value_ranges = [(queued_tab, queued_range) for queued_tab, queued_range in self.value_ranges if queued_tab not in superseded]
+        self.requests.extend(requests)
+        self.value_ranges.append((tab, value_range))
+        self.data_hashes[tab] = data_hash
+
+    @Logger(mode="short")
+    def flush(self) -> None:
+        if not self.value_ranges:
+            return
+        try:
+            _send_write_requests(self.sheet, self.requests, [value_range for _, value_range in self.value_ranges])
+        except Exception as e:
+            Logger.note(f"Error writing batched data: {e}")
+            raise RuntimeError(f"Failed to write batched data: {e}") from e
+        for tab, data_hash in self.data_hashes.items():
+            tab._stored_data_hash = data_hash
+            tab._dirty_cells = []
+        Logger.note(f"Batched data written successfully to {len(self.data_hashes)} tab(s).")
+
+
+_active_write_batch: ContextVar[Optional[_WriteBatch]] = ContextVar("smartspread_write_batch", default=None)
 
 
 class SmartTab:
@@ -38,7 +148,9 @@ class SmartTab:
                  sheet: gspread.Spreadsheet,
                  tab_name="",
                  data_format: Literal["DataFrame", "list", "dict"] = "DataFrame",
-                 keep_number_formatting: bool = False):
+                 keep_number_formatting: bool = False,
+                 worksheet: Optional[gspread.Worksheet] = None,
+                 pre_fetched_values: Optional[list[list]] = None):
         """Initialize SmartTab for a specific worksheet.
         
         Args:
@@ -46,6 +158,8 @@ class SmartTab:
             tab_name: Name of the worksheet tab
             data_format: Format for data operations ('DataFrame', 'list', 'dict')
             keep_number_formatting: If True, preserve number formatting as strings
+            worksheet: Already fetched worksheet object, skips the lookup (optional)
+            pre_fetched_values: Raw cell values from a batched read, skips the initial read (optional)
             
         Raises:
             ValueError: If sheet, tab_name invalid or data_format not supported
@@ -61,50 +175,86 @@ class SmartTab:
         self.tab_name = tab_name
         self.data_format = data_format
         self.keep_number_formatting = keep_number_formatting
+        self._pre_fetched_values = pre_fetched_values
+        self._last_update_time: Optional[str] = None
+        self._dirty_cells: list[gspread.Cell] = []
+        self._pending_new_rows: list[dict] = []
+        self._pattern_cache: dict[str, re.Pattern] = {}
         
-        if not self._tab_exists:
-            self._create_tab()
+        if worksheet is None:
+            worksheet = self._fetch_worksheet()
+        if worksheet is None:
+            worksheet = self._create_tab()
+            # A freshly created tab is empty, no need to read it
+            self._pre_fetched_values = []
+        self._worksheet: gspread.Worksheet = worksheet
         
+        # Data is read on first access, so write-only use never downloads the tab
+        self._data_loaded = False
+        self._stored_data_hash = None
+
+    def __str__(self):
+        return f"Tab '{self.tab_name}'"
+
+    @property
+    def data(self) -> Union[pd.DataFrame, list[dict], list[list]]:
+        if not self._data_loaded:
+            self._load_data()
+        if self._pending_new_rows:
+            self._apply_pending_rows()
+        return self._data
+
+    @data.setter
+    def data(self, value: Union[pd.DataFrame, list[dict], list[list]]) -> None:
+        self._data = value
+        self._data_loaded = True
+        self._pending_new_rows = []
+        # Cell updates computed against the replaced data no longer apply
+        self._dirty_cells = []
+        # Values fetched before the data was replaced would be stale on the next read
+        self._pre_fetched_values = None
+
+    def _load_data(self) -> None:
         try:
-            self.data: pd.DataFrame | list[dict] | list[list] = self.read_data()
-            self._stored_data_hash = _calculate_data_hash(self.data)
+            self.data = self.read_data()
+            self._stored_data_hash = _calculate_data_hash(self._data)
         except ValueError:
             self.data = pd.DataFrame()
             self._stored_data_hash = None
 
-    def __str__(self):
-        return f"Tab '{self.tab_name}'"
-
     def __repr__(self):
         return self.__str__()
 
-    @property
-    def _tab_exists(self) -> bool:
-        try:
-            self._worksheet
-            return True
-        except:
-            return False
-
-    @cached_property
-    def _worksheet(self) -> gspread.Worksheet:
+    def _fetch_worksheet(self) -> Optional[gspread.Worksheet]:
         try:
             return self.sheet.worksheet(self.tab_name)
         except gspread.exceptions.WorksheetNotFound:
-            raise ValueError(f"Worksheet '{self.tab_name}' not found") from None
+            return None
         except Exception as e:
             raise RuntimeError(f"Failed to access worksheet '{self.tab_name}': {e}") from e
 
+    def _fetch_last_update_time(self) -> Optional[str]:
+        # Drive metadata request, much smaller than downloading the tab values
+        try:
+            return self.sheet.get_lastUpdateTime()
+        except Exception:
+            return None
+
     @Logger()
-    def _create_tab(self) -> None:
+    def _create_tab(self) -> gspread.Worksheet:
         try:
-            self.sheet.add_worksheet(title=self.tab_name, rows=1000, cols=26)
+            worksheet = self.sheet.add_worksheet(title=self.tab_name, rows=1000, cols=26)
             Logger.note(f"Tab '{self.tab_name}' created.")
+            return worksheet
         except Exception as e:
             Logger.note(f"Error creating tab '{self.tab_name}': {e}")
             raise RuntimeError(f"Failed to create tab '{self.tab_name}': {e}") from e
 
     def _read_values(self) -> list[list]:
+        if self._pre_fetched_values is not None:
+            # Injected values are only valid for the first read
+            values, self._pre_fetched_values = self._pre_fetched_values, None
+            return values
         try:
             if self.keep_number_formatting:
                 return self._worksheet.get_all_values()
@@ -151,42 +301,39 @@ class SmartTab:
                     for i, col in enumerate(df.columns)
             ]
 
-            for col in df.columns:
-                # Replace empty strings with None for proper type inference
-                df[col] = df[col].replace("", None)
-                
-                # Skip type conversion if all values are None
-                if df[col].isna().all():
-                    continue
-                
-                # Try numeric conversion only on non-null values
-                try:
-                    # Try int conversion
-                    converted = pd.to_numeric(df[col], errors='coerce')
-                    if converted.notna().any() and (converted.dropna() % 1 == 0).all():
-                        df[col] = converted.astype('Int64')  # Nullable integer
-                        continue
-                except (ValueError, TypeError):
-                    pass
-                
-                try:
-                    # Try float conversion
-                    converted = pd.to_numeric(df[col], errors='coerce')
-                    if converted.notna().any():
-                        df[col] = converted
-                        continue
-                except (ValueError, TypeError):
-                    pass
-                
+            # Replace empty strings with None for proper type inference
+            df = df.replace("", None)
+
+            # Infer all columns in one pass: whole numbers -> Int64, other numbers -> float,
+            # anything else stays string. Columns that are entirely None are left untouched.
+            numeric = df.apply(pd.to_numeric, errors='coerce')
+            has_numbers = numeric.notna().any()
+            is_whole = (numeric.fillna(0) % 1 == 0).all()
+            # Whole numbers beyond the int64 range (e.g. 1e19) stay float; int and bool columns always fit
+            fits_int64 = pd.Series(
+                    [values.dtype.kind in "ib" or values.abs().max() < 2 ** 63 for _, values in numeric.items()],
+                    index=df.columns, dtype=bool
+            )
+            has_values = df.notna().any()
+
+            int_cols = df.columns[has_numbers & is_whole & fits_int64]
+            float_cols = df.columns[has_numbers & ~(is_whole & fits_int64)]
+            str_cols = df.columns[has_values & ~has_numbers]
+
+            if len(int_cols):
+                df[int_cols] = numeric[int_cols].astype('Int64')  # Nullable integer
+            if len(float_cols):
+                df[float_cols] = numeric[float_cols]
+            if len(str_cols):
                 # Keep as string, but preserve None values
-                df[col] = df[col].astype(str).replace('None', None)
+                df[str_cols] = df[str_cols].astype(str).replace('None', None)
 
             Logger.note(f"Tab '{self.tab_name}' successfully read as DataFrame.")
             if self.data_format == "dict":
-                result = df.to_dict(orient="records")
-                return [{k: (None if pd.isna(v) else v) for k, v in row.items()} for row in result]
+                columns = df.columns.tolist()
+                return [dict(zip(columns, row)) for row in _frame_to_rows(df)]
             if self.data_format == "list":
-                return [df.columns.tolist()] + [[None if pd.isna(v) else v for v in row] for row in df.values.tolist()]
+                return [df.columns.tolist()] + _frame_to_rows(df)
             return df
         except Exception as e:
             Logger.note(f"Error reading tab '{self.tab_name}': {e}")
@@ -196,8 +343,7 @@ class SmartTab:
     def _data_as_list(self) -> list[list]:
         if isinstance(self.data, pd.DataFrame):
             # Replace NaN/None with empty strings for Google Sheets compatibility
-            df_clean = self.data.astype(object).fillna("")
-            values = [df_clean.columns.tolist()] + df_clean.values.tolist()
+            values = [self.data.columns.tolist()] + _frame_to_rows(self.data, missing="")
         elif isinstance(self.data, list) and all(isinstance(row, dict) for row in self.data):
             keys = list(self.data[0].keys())
             values = [keys] + [[("" if pd.isna(v) else v) for v in (row.get(k, "") for k in keys)] for row in self.data]
@@ -239,7 +385,18 @@ class SmartTab:
             df = self._data_as_dataframe
             if column not in df.columns:
                 raise ValueError(f"Column '{column}' not found in the data")
-            matching_rows = df[df[column].str.contains(pattern, na=False)]
+            values = df[column]
+            if not pd.api.types.is_string_dtype(values):
+                # Numeric or mixed columns have no .str accessor
+                values = values.astype("string")
+            if _REGEX_SPECIAL_CHARS.isdisjoint(pattern):
+                # Plain substring, skip the regex engine
+                mask = values.str.contains(pattern, regex=False, na=False)
+            else:
+                if pattern not in self._pattern_cache:
+                    self._pattern_cache[pattern] = re.compile(pattern)
+                mask = values.str.contains(self._pattern_cache[pattern], na=False)
+            matching_rows = df[mask]
             return matching_rows
         except ValueError:
             raise
@@ -259,27 +416,59 @@ class SmartTab:
             ValueError: If data is empty
             RuntimeError: If writing fails
         """
-        if self._stored_data_hash and self._stored_data_hash == _calculate_data_hash(self.data):
-            Logger.note(f"Data for tab '{self.tab_name}' has not changed.")
-            return
         try:
+            # Hashed once; the same digest is stored after a successful write
+            data_hash = _calculate_data_hash(self.data)
+            if self._stored_data_hash and self._stored_data_hash == data_hash:
+                Logger.note(f"Data for tab '{self.tab_name}' has not changed.")
+                return
             values = self._data_as_list
             if not values or not values[0]:
                 raise ValueError("Cannot write empty data to Google Sheets")
             
+            num_rows, num_cols = len(values), max(len(row) for row in values)
+            self._ensure_grid(num_rows, num_cols)
+
+            sheet_id = self._worksheet.id
+            requests = []
             if overwrite_tab:
-                self._worksheet.clear()
-                self._worksheet.update(values, value_input_option='USER_ENTERED')
+                requests.append({
+                        "updateCells": {
+                                "range" : {"sheetId": sheet_id},
+                                "fields": "userEnteredValue",
+                        }
+                })
+                value_range = absolute_range_name(self.tab_name)
             else:
-                start_cell = 'A1'
-                end_cell = f'{chr(65 + len(values[0]) - 1)}{len(values)}'
-                self._worksheet.update(f'{start_cell}:{end_cell}', values, value_input_option='USER_ENTERED')
+                end_cell = rowcol_to_a1(num_rows, num_cols)
+                value_range = absolute_range_name(self.tab_name, f'A1:{end_cell}')
             if as_table:
-                self._worksheet.set_basic_filter()
-                self._worksheet.freeze(rows=1)
-                self._worksheet.format('A1:Z1', {'textFormat': {'bold': True}})
+                requests.append({"setBasicFilter": {"filter": {"range": {"sheetId": sheet_id}}}})
+                requests.append({
+                        "updateSheetProperties": {
+                                "properties": {"sheetId": sheet_id, "gridProperties": {"frozenRowCount": 1}},
+                                "fields"    : "gridProperties.frozenRowCount",
+                        }
+                })
+                requests.append({
+                        "repeatCell": {
+                                "range" : {"sheetId": sheet_id, "startRowIndex": 0, "endRowIndex": 1, "startColumnIndex": 0, "endColumnIndex": num_cols},
+                                "cell"  : {"userEnteredFormat": {"textFormat": {"bold": True}}},
+                                "fields": "userEnteredFormat.textFormat.bold",
+                        }
+                })
+
+            value_range = {"range": value_range, "values": values}
+            write_batch = _active_write_batch.get()
+            if write_batch is not None and write_batch.sheet.id == self.sheet.id:
+                write_batch.add(self, requests, value_range, data_hash, overwrite_tab)
+                Logger.note(f"Data for '{self.tab_name}' queued for batched write.")
+                return
+
+            _send_write_requests(self.sheet, requests, [value_range])
 
-            self._stored_data_hash = _calculate_data_hash(self.data)
+            self._stored_data_hash = data_hash
+            self._dirty_cells = []
             Logger.note(f"Data written successfully to '{self.tab_name}'.", )
 
         except ValueError:
@@ -288,6 +477,24 @@ class SmartTab:
             Logger.note(f"Error writing data to tab '{self.tab_name}': {e}")
             raise RuntimeError(f"Failed to write data to tab '{self.tab_name}': {e}") from e
 
+    async def awrite_data(self, overwrite_tab: bool = False, as_table: bool = False) -> None:
+        """Async variant of write_data().
+        
+        The blocking requests run in the event loop's default executor, so writes
+        to several tabs can overlap with asyncio.gather. Inside SmartSpread.batch()
+        the write is only queued, so it runs inline.
+        
+        Args:
+            overwrite_tab: If True, clear tab before writing
+            as_table: If True, format as table with frozen header
+        """
+        write_batch = _active_write_batch.get()
+        if write_batch is not None and write_batch.sheet.id == self.sheet.id:
+            self.write_data(overwrite_tab=overwrite_tab, as_table=as_table)
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, partial(self.write_data, overwrite_tab=overwrite_tab, as_table=as_table))
+
     @Logger(mode="short")
     def update_row_by_column_pattern(self, column: str, value, updates: dict) -> None:
         """Update or insert a row based on column value match.
@@ -308,54 +515,126 @@ class SmartTab:
         if not updates:
             raise ValueError("updates dictionary cannot be empty")
         
-        # Ensure the data is a DataFrame for easier manipulation
-        df = self._data_as_dataframe
-
-        # Add the target column if it doesn't exist
-        if column not in df.columns:
-            df[column] = None
-
-        # Ensure all update columns are in the DataFrame
-        for update_column in updates.keys():
-            if update_column not in df.columns:
-                df[update_column] = None
-
-        # Find the first matching row
-        matching_rows = df[df[column] == value]
-        if matching_rows.empty:
-            # No match found, add a new row with the updates
-            new_row = {col: None for col in df.columns}  # Default row with None values
-            new_row.update({column: value})
-            new_row.update(updates)  # Apply updates to the new row
-
-            # Append the new row
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+        if not self._data_loaded:
+            self._load_data()
+
+        # Ensure the data is a DataFrame for easier manipulation. Rows inserted by
+        # earlier calls are still buffered and are not part of this frame.
+        df = self._data if isinstance(self._data, pd.DataFrame) else pd.DataFrame(self._data)
+
+        # Add the target column and all update columns if they don't exist
+        for new_column in [column, *updates.keys()]:
+            if new_column not in df.columns:
+                df[new_column] = None
+                self._dirty_cells.append(gspread.Cell(1, df.columns.get_loc(new_column) + 1, new_column))
+
+        # Find the first matching row position without materializing the matching rows
+        matches = (df[column] == value).to_numpy(dtype=bool, na_value=False).nonzero()[0]
+        if not len(matches):
+            pending_index = self._find_pending_row(column, value)
+            if pending_index is None:
+                # No match found, buffer a new row with the updates; buffered rows are
+                # appended to the data in a single concat when it is next accessed
+                new_row = {column: value}
+                new_row.update(updates)
+                self._pending_new_rows.append(new_row)
+                pending_index = len(self._pending_new_rows) - 1
+            else:
+                # Match found among the buffered rows, update it
+                new_row = self._pending_new_rows[pending_index]
+                new_row.update(updates)
+            sheet_row = len(df) + pending_index + 2
+            self._dirty_cells.extend(
+                    gspread.Cell(sheet_row, df.columns.get_loc(cell_column) + 1, _cell_value(cell_value))
+                    for cell_column, cell_value in new_row.items()
+            )
         else:
             # Match found, update the first matching row
-            row_index = matching_rows.index[0]
+            row_position = int(matches[0])
             for update_column, update_value in updates.items():
-                if update_column not in df.columns:
-                    # Add the update column if it doesn't exist
-                    df[update_column] = None
+                column_position = df.columns.get_loc(update_column)
                 # Cast to object dtype if assigning non-numeric value to numeric column
                 if df[update_column].dtype != object and not isinstance(update_value, (int, float, type(None))):
                     df[update_column] = df[update_column].astype(object)
-                df.at[row_index, update_column] = update_value
+                try:
+                    df.iat[row_position, column_position] = update_value
+                except (TypeError, ValueError):
+                    # Value does not fit the column dtype (e.g. a number into a string column)
+                    df[update_column] = df[update_column].astype(object)
+                    df.iat[row_position, column_position] = update_value
+                self._dirty_cells.append(gspread.Cell(row_position + 2, column_position + 1, _cell_value(update_value)))
+
+        # Update the stored data to reflect changes, keeping the buffered rows
+        self._data = self._dataframe_as_format(df)
+
+    def _find_pending_row(self, column: str, value) -> Optional[int]:
+        # Scanned in order with the rule df[column] == value applies: missing values never match
+        if _is_missing(value):
+            return None
+        for index, row in enumerate(self._pending_new_rows):
+            row_value = row.get(column)
+            if not _is_missing(row_value) and row_value == value:
+                return index
+        return None
+
+    def _apply_pending_rows(self) -> None:
+        df = self._data if isinstance(self._data, pd.DataFrame) else pd.DataFrame(self._data)
+        df = pd.concat([df, pd.DataFrame(self._pending_new_rows, columns=df.columns)], ignore_index=True)
+        self._pending_new_rows = []
+        self._data = self._dataframe_as_format(df)
 
-        # Update self.data to reflect changes
-        if self.data_format.lower() == "dataframe":
-            self.data = df
+    def _dataframe_as_format(self, df: pd.DataFrame) -> Union[pd.DataFrame, list[dict], list[list]]:
         if self.data_format.lower() == "dict":
-            self.data = df.to_dict(orient="records")
+            columns = df.columns.tolist()
+            return [dict(zip(columns, row)) for row in _frame_to_rows(df)]
         if self.data_format.lower() == "list":
-            self.data = [df.columns.tolist()] + df.values.tolist()
-    
+            return [df.columns.tolist()] + _frame_to_rows(df)
+        return df
+
+    @Logger(mode="short")
+    def flush(self) -> None:
+        """Write the cells changed by update_row_by_column_pattern in a single request.
+        
+        Cheaper than write_data for a few row updates, as only the touched cells are sent.
+        
+        Raises:
+            RuntimeError: If writing fails
+        """
+        if not self._dirty_cells:
+            Logger.note(f"No pending cell updates for tab '{self.tab_name}'.")
+            return
+        try:
+            self._ensure_grid(max(cell.row for cell in self._dirty_cells), max(cell.col for cell in self._dirty_cells))
+            self._worksheet.update_cells(self._dirty_cells, value_input_option='USER_ENTERED')
+            Logger.note(f"{len(self._dirty_cells)} cell(s) written to '{self.tab_name}'.")
+            self._dirty_cells = []
+        except Exception as e:
+            Logger.note(f"Error flushing cell updates to tab '{self.tab_name}': {e}")
+            raise RuntimeError(f"Failed to flush cell updates to tab '{self.tab_name}': {e}") from e
+
+    def _ensure_grid(self, num_rows: int, num_cols: int) -> None:
+        if num_rows > self._worksheet.row_count or num_cols > self._worksheet.col_count:
+            # Values outside the grid are rejected, grow the tab first
+            self._worksheet.resize(rows=max(num_rows, self._worksheet.row_count), cols=max(num_cols, self._worksheet.col_count))
+
     def refresh(self) -> None:
         """Reload data from Google Sheets and clear cached worksheet.
         
-        Use this after external changes to get the latest data.
+        Use this after external changes to get the latest data. If neither the
+        spreadsheet nor the local data changed since the last refresh, the
+        reload is skipped.
         """
-        if hasattr(self, '_worksheet'):
-            del self._worksheet
+        last_update_time = self._fetch_last_update_time()
+        if (self._data_loaded and last_update_time is not None and last_update_time == self._last_update_time
+                and self._stored_data_hash == _calculate_data_hash(self.data)):
+            Logger.note(f"Tab '{self.tab_name}' has not changed since the last refresh.")
+            return
+
+        worksheet = self._fetch_worksheet()
+        if worksheet is None:
+            raise ValueError(f"Worksheet '{self.tab_name}' not found")
+        self._worksheet = worksheet
         self.data = self.read_data()
         self._stored_data_hash = _calculate_data_hash(self.data)
+        self._last_update_time = last_update_time
+        self._dirty_cells = []
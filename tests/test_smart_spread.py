@@ -1,20 +1,22 @@
-import json
+import asyncio
+import orjson
 import pytest
 import pandas as pd
 import time
+from pathlib import Path
+from types import SimpleNamespace
 from smartspread import SmartSpread, SmartTab
 from smartspread.smart_tab import _calculate_data_hash
 
 
 @pytest.fixture(scope="session")
 def credentials():
-    with open("config.json", "r") as f:
-        return json.load(f)
+    return orjson.loads(Path("config.json").read_bytes())
 
 
 @pytest.fixture(scope="session")
 def test_sheet_name():
-    return f"SmartSpread_Test_{int(time.time())}"
+    return f"ST_{time.time_ns() & 0xFFFFFFFF:x}"
 
 
 @pytest.fixture(scope="session")
@@ -27,6 +29,7 @@ def spread(credentials, test_sheet_name):
         _ = s.sheet
     except ValueError:
         s._create_sheet()
+    s._prefetch_all()
     return s
 
 
@@ -121,6 +124,26 @@ class TestSmartTab:
         row = tab_read.data[tab_read.data["ID"] == 2]
         assert row["Status"].values[0] == "completed"
     
+    def test_update_row_flush(self, spread):
+        df = pd.DataFrame({
+            "ID": [1, 2, 3],
+            "Status": ["pending", "pending", "pending"]
+        })
+        
+        tab = spread.tab(tab_name="TestTab_Flush", data_format="DataFrame")
+        tab.data = df
+        tab._stored_data_hash = None
+        tab.write_data(overwrite_tab=True)
+        
+        tab.update_row_by_column_pattern(column="ID", value=2, updates={"Status": "completed"})
+        tab.update_row_by_column_pattern(column="ID", value=4, updates={"Status": "new"})
+        tab.flush()
+        assert tab._dirty_cells == []
+        
+        tab_read = spread.tab(tab_name="TestTab_Flush", data_format="DataFrame")
+        assert tab_read.data["Status"].tolist() == ["pending", "completed", "pending", "new"]
+        assert tab_read.data["ID"].tolist() == [1, 2, 3, 4]
+    
     def test_filter_rows_by_column(self, spread):
         df = pd.DataFrame({
             "Name": ["Alice", "Bob", "Alex", "Charlie"],
@@ -143,6 +166,35 @@ class TestSmartTab:
         assert spread.tab_exists(tab_name) is True
         assert spread.tab_exists("NonExistentTab") is False
     
+    def test_tabs_batched_read(self, spread):
+        for name, value in [("TestTab_Batch1", 1), ("TestTab_Batch2", 2)]:
+            tab = spread.tab(tab_name=name, data_format="DataFrame")
+            tab.data = pd.DataFrame({"A": [value]})
+            tab._stored_data_hash = None
+            tab.write_data(overwrite_tab=True)
+        
+        tabs = spread.tabs(["TestTab_Batch1", "TestTab_Batch2", "TestTab_Batch3"])
+        assert [tab.tab_name for tab in tabs] == ["TestTab_Batch1", "TestTab_Batch2", "TestTab_Batch3"]
+        assert tabs[0].data["A"].tolist() == [1]
+        assert tabs[1].data["A"].tolist() == [2]
+        assert tabs[2].data.empty
+    
+    def test_batch_write(self, spread):
+        tab_a = spread.tab(tab_name="TestTab_BatchWriteA", data_format="DataFrame")
+        tab_b = spread.tab(tab_name="TestTab_BatchWriteB", data_format="DataFrame")
+        with spread.batch():
+            tab_a.data = pd.DataFrame({"A": [1, 2]})
+            tab_a._stored_data_hash = None
+            tab_a.write_data(overwrite_tab=True)
+            tab_b.data = pd.DataFrame({"B": ["x"]})
+            tab_b._stored_data_hash = None
+            tab_b.write_data(overwrite_tab=True, as_table=True)
+            assert tab_a._stored_data_hash is None
+        
+        assert tab_a._stored_data_hash is not None
+        assert spread.tab(tab_name="TestTab_BatchWriteA").data["A"].tolist() == [1, 2]
+        assert spread.tab(tab_name="TestTab_BatchWriteB").data["B"].tolist() == ["x"]
+    
     def test_write_data_no_change(self, spread):
         df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
         tab = spread.tab(tab_name="TestTab_NoChange", data_format="DataFrame")
@@ -176,6 +228,18 @@ class TestSmartTab:
         assert tab_read.data["Email"].isna().all()
         assert tab_read.data["Phone"].isna().all()
     
+    def test_wide_data(self, spread):
+        df = pd.DataFrame({f"Col{i}": [i, i * 2] for i in range(30)})
+        
+        tab = spread.tab(tab_name="TestTab_Wide", data_format="DataFrame")
+        tab.data = df
+        tab._stored_data_hash = None
+        tab.write_data(as_table=True)
+        
+        tab_read = spread.tab(tab_name="TestTab_Wide", data_format="DataFrame")
+        assert list(tab_read.data.columns) == [f"Col{i}" for i in range(30)]
+        assert tab_read.data["Col29"].tolist() == [29, 58]
+    
     def test_nan_roundtrip(self, spread):
         df = pd.DataFrame({
             "A": [1, 2, 3],
@@ -315,6 +379,25 @@ class TestDataHash:
         hash_value = _calculate_data_hash(df)
         assert isinstance(hash_value, str)
     
+    def test_hash_ignores_integer_dtype(self):
+        df = pd.DataFrame({'a': [1, 2], 'b': [3.5, None], 'c': ['x', 'y']})
+        assert _calculate_data_hash(df) == _calculate_data_hash(df.astype({'a': 'Int64'}))
+        assert _calculate_data_hash(df) != _calculate_data_hash(df.assign(a=[1, 3]))
+        with_na = pd.DataFrame({'a': [1, None]}, dtype='Int64')
+        assert _calculate_data_hash(with_na) != _calculate_data_hash(pd.DataFrame({'a': [1, 0]}, dtype='Int64'))
+    
+    def test_hash_detects_renamed_columns(self):
+        assert _calculate_data_hash(pd.DataFrame({'a': [1]})) != _calculate_data_hash(pd.DataFrame({'b': [1]}))
+        assert _calculate_data_hash([{'a': 1}]) != _calculate_data_hash([{'b': 1}])
+    
+    def test_hash_with_nested_values_in_dict(self):
+        hash_value = _calculate_data_hash([{'id': 1, 'tags': ['x', 'y']}])
+        assert isinstance(hash_value, str)
+    
+    def test_hash_with_ints_beyond_64_bits(self):
+        assert _calculate_data_hash([[2 ** 70]]) != _calculate_data_hash([[2 ** 70 + 1]])
+        assert isinstance(_calculate_data_hash([{'id': 2 ** 70}]), str)
+    
     def test_list_format_sanitizes_pd_na(self, spread):
         df = pd.DataFrame({'id': [1, None], 'name': ['Alice', 'Bob']})
         tab = spread.tab(tab_name="TestTab_ListNA", data_format="DataFrame")
@@ -340,3 +423,165 @@ class TestDataHash:
         import json
         json.dumps(tab_dict.data)  # Should not raise TypeError
         assert tab_dict.data[1]['id'] is None  # Second row id should be None
+
+
+def _offline_tab(values, data_format="DataFrame"):
+    # Worksheet and values are supplied up front, so no API call is made
+    return SmartTab(sheet=SimpleNamespace(id="offline"), tab_name="Offline", data_format=data_format,
+                    worksheet=SimpleNamespace(id=0), pre_fetched_values=values)
+
+
+class TestPendingRows:
+    
+    def test_upsert_matches_first_buffered_row(self):
+        tab = _offline_tab([["ID", "S"], [9, "a"]], data_format="dict")
+        tab.update_row_by_column_pattern("ID", 1, {"S": "x"})
+        tab.update_row_by_column_pattern("ID", 2, {"S": "y"})
+        tab.update_row_by_column_pattern("ID", 1, {"S": "y"})
+        tab.update_row_by_column_pattern("S", "y", {"Z": "hit"})
+        assert tab.data == [{"ID": 9, "S": "a", "Z": None}, {"ID": 1, "S": "y", "Z": "hit"}, {"ID": 2, "S": "y", "Z": None}]
+    
+    def test_upsert_never_matches_missing_values(self):
+        tab = _offline_tab([["ID", "S"], [9, "a"]], data_format="dict")
+        tab.update_row_by_column_pattern("ID", 5, {"S": None})
+        tab.update_row_by_column_pattern("S", None, {"Z": "hit"})
+        assert tab.data == [{"ID": 9, "S": "a", "Z": None}, {"ID": 5, "S": None, "Z": None}, {"ID": None, "S": None, "Z": "hit"}]
+    
+    def test_upsert_dirty_cells_address_buffered_rows(self):
+        tab = _offline_tab([["ID", "S"], [9, "a"]], data_format="dict")
+        tab.update_row_by_column_pattern("ID", 1, {"S": "x"})
+        tab.update_row_by_column_pattern("ID", 2, {"S": "y"})
+        tab.update_row_by_column_pattern("ID", 2, {"S": "z"})
+        cells = {(cell.row, cell.col): cell.value for cell in tab._dirty_cells}
+        assert cells[(3, 1)] == 1 and cells[(4, 1)] == 2
+        assert cells[(4, 2)] == "z"
+        assert tab.data == [{"ID": 9, "S": "a"}, {"ID": 1, "S": "x"}, {"ID": 2, "S": "z"}]
+
+
+class TestReadData:
+    
+    def test_whole_numbers_beyond_int64_stay_float(self):
+        tab = _offline_tab([["Big", "Small"], [1e19, 1], [2 ** 70, 2]])
+        assert tab.data["Big"].dtype == "float64"
+        assert tab.data["Big"].tolist() == [1e19, float(2 ** 70)]
+        assert tab.data["Small"].dtype == "Int64"
+    
+    def test_bool_columns_read_as_int(self):
+        tab = _offline_tab([["ID", "Flag"], [1, True], [2, False]])
+        assert tab.data["Flag"].dtype == "Int64"
+        assert tab.data["Flag"].tolist() == [1, 0]
+
+
+class TestFlush:
+    
+    def test_setting_data_drops_pending_cell_updates(self):
+        tab = _offline_tab([["ID", "S"], [1, "a"]])
+        tab.update_row_by_column_pattern("ID", 1, {"S": "b"})
+        assert tab._dirty_cells
+        tab.data = pd.DataFrame({"X": [1]})
+        assert tab._dirty_cells == []
+    
+    def test_setting_data_drops_prefetched_values(self):
+        sheet = SimpleNamespace(id="offline", values_batch_get=lambda ranges, params: {"valueRanges": [{"values": [["ID"], [2]]}]})
+        tab = SmartTab(sheet=sheet, tab_name="Offline", worksheet=SimpleNamespace(id=0), pre_fetched_values=[])
+        tab.data = pd.DataFrame({"ID": [2]})
+        assert tab.read_data()["ID"].tolist() == [2]
+    
+    def test_flush_grows_grid_for_new_cells(self):
+        resized, written = [], []
+        worksheet = SimpleNamespace(
+                id=0, row_count=2, col_count=2,
+                resize=lambda rows, cols: resized.append((rows, cols)),
+                update_cells=lambda cells, value_input_option: written.extend(cells),
+        )
+        tab = SmartTab(sheet=SimpleNamespace(id="offline"), tab_name="Offline", worksheet=worksheet,
+                       pre_fetched_values=[["ID", "S"], [1, "a"]])
+        tab.update_row_by_column_pattern("ID", 2, {"S": "b", "T": "c"})
+        tab.flush()
+        assert resized == [(3, 3)]
+        assert written and tab._dirty_cells == []
+
+
+class _RecordingSheet:
+    # Minimal in-memory spreadsheet that records the API calls made against it
+    
+    def __init__(self, tabs):
+        self.id = "offline"
+        self.calls = []
+        self.values = dict(tabs)
+        self._worksheets = {
+                name: SimpleNamespace(id=index, title=name, row_count=1000, col_count=26)
+                for index, name in enumerate(tabs)
+        }
+    
+    def worksheets(self):
+        self.calls.append(("worksheets",))
+        return list(self._worksheets.values())
+    
+    def worksheet(self, name):
+        self.calls.append(("worksheet", name))
+        return self._worksheets[name]
+    
+    def values_batch_get(self, ranges, params=None):
+        self.calls.append(("values_batch_get", len(ranges)))
+        return {"valueRanges": [{"values": self.values[name.strip("'")]} for name in ranges]}
+    
+    def batch_update(self, body):
+        self.calls.append(("batch_update", len(body["requests"])))
+    
+    def values_batch_update(self, body):
+        self.calls.append(("values_batch_update", len(body["data"])))
+
+
+@pytest.fixture
+def offline_spread(monkeypatch):
+    monkeypatch.setattr("gspread.service_account_from_dict", lambda data: SimpleNamespace(session=SimpleNamespace(mount=lambda prefix, adapter: None)))
+    s = SmartSpread(sheet_identifier="Offline", service_account_data={"type": "service_account"})
+    s.sheet = _RecordingSheet({"A": [["ID"], [1]], "B": [["ID"], [2]]})
+    return s
+
+
+class TestAsync:
+    
+    def test_awrite_data_writes_each_tab(self, offline_spread):
+        tab_a, tab_b = offline_spread.tabs(["A", "B"])
+        tab_a.data = pd.DataFrame({"ID": [10]})
+        tab_b.data = pd.DataFrame({"ID": [20]})
+        offline_spread.sheet.calls.clear()
+        
+        async def write_all():
+            await asyncio.gather(tab_a.awrite_data(overwrite_tab=True), tab_b.awrite_data(overwrite_tab=True))
+        
+        asyncio.run(write_all())
+        assert sorted(offline_spread.sheet.calls) == [("batch_update", 1)] * 2 + [("values_batch_update", 1)] * 2
+        assert tab_a._stored_data_hash == _calculate_data_hash(tab_a.data)
+        assert tab_b._stored_data_hash == _calculate_data_hash(tab_b.data)
+    
+    def test_awrite_data_inside_batch_is_queued(self, offline_spread):
+        tab_a, tab_b = offline_spread.tabs(["A", "B"])
+        tab_a.data = pd.DataFrame({"ID": [10]})
+        tab_b.data = pd.DataFrame({"ID": [20]})
+        offline_spread.sheet.calls.clear()
+        
+        async def write_all():
+            await asyncio.gather(tab_a.awrite_data(overwrite_tab=True), tab_b.awrite_data(overwrite_tab=True))
+        
+        with offline_spread.batch():
+            asyncio.run(write_all())
+            assert offline_spread.sheet.calls == []
+            assert tab_a._stored_data_hash is None
+        assert offline_spread.sheet.calls == [("batch_update", 2), ("values_batch_update", 2)]
+        assert tab_a._stored_data_hash == _calculate_data_hash(tab_a.data)
+        assert tab_b._stored_data_hash == _calculate_data_hash(tab_b.data)
+    
+    def test_atab_reads_in_executor(self, offline_spread):
+        tab = asyncio.run(offline_spread.atab(tab_name="A"))
+        # Read already happened in the worker, before .data is touched here
+        assert offline_spread.sheet.calls == [("worksheet", "A"), ("values_batch_get", 1)]
+        assert tab.data["ID"].tolist() == [1]
+    
+    def test_atabs_keeps_order(self, offline_spread):
+        tabs = asyncio.run(offline_spread.atabs(["B", "A"], data_format="dict", max_concurrency=1))
+        assert [tab.tab_name for tab in tabs] == ["B", "A"]
+        assert [tab.data for tab in tabs] == [[{"ID": 2}], [{"ID": 1}]]
+        assert offline_spread.sheet.calls.count(("values_batch_get", 1)) == 2